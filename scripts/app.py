@@ -1,19 +1,60 @@
 #!/usr/bin/env python3
 
 
-import sys, random
+import sys, csv, os, pickle, functools, asyncio
+from collections import deque
 from dataclasses import dataclass
 from typing import Callable
 
-import pandas as pd
+import numpy as np
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtCore import Qt
+import PySide6.QtAsyncio as QtAsyncio
+
+
+ICON_PATHS : tuple[str, ...] = (
+    "data/eye.png",
+    "data/eye-slash.png",
+    "data/square-caret-right.png",
+    "data/square-caret-left.png",
+    "data/square-plus.png",
+    "data/square-minus.png",
+    "data/字.png",
+)
+"""Every icon the UI uses, roughly in request order."""
+
+_PRELOADED_IMAGES : dict[str, QtGui.QImage] = {}
+"""Images decoded ahead of time by `IconPreloader`, consumed by `get_icon`."""
+
+
+class IconPreloader(QtCore.QRunnable):
+    """
+    Decodes the icon PNGs into `QImage`s on a worker thread, overlapping disk I/O and PNG
+    decoding with the rest of app startup. `QImage` is safe to build off the GUI thread
+    (`QPixmap` is not, so the conversion happens in `get_icon` on the GUI thread).
+    """
+
+    def run(self) -> None:
+        for path in ICON_PATHS:
+            _PRELOADED_IMAGES[path] = QtGui.QImage(path)
+
+
+@functools.cache
+def get_icon(path: str) -> QtGui.QIcon:
+    """Load the icon at `path`, decoding each file only once no matter how often it is requested."""
+    image = _PRELOADED_IMAGES.get(path)
+    if image is not None:
+        return QtGui.QIcon(QtGui.QPixmap.fromImage(image))
+
+    # Not pre-decoded (yet); let QIcon load the file lazily as before.
+    return QtGui.QIcon(path)
 
 
 def clear_layout(layout: QtWidgets.QLayout) -> None:
     """Remove all children from `layout`."""
-    while layout.count():
-        item = layout.takeAt(0)
+    # Take from the tail: takeAt(0) shifts every remaining item, turning the loop quadratic.
+    for i in reversed(range(layout.count())):
+        item = layout.takeAt(i)
         widget = item.widget()
         if widget is not None:
             widget.deleteLater()
@@ -21,30 +62,115 @@ def clear_layout(layout: QtWidgets.QLayout) -> None:
 
 @dataclass
 class Entry:
-    """Single entry in the word database."""
+    """Read-only view of a single entry in the word database, built on demand from the `State` column arrays."""
     level : int
     """Which HSK2.0 level does this word or expression belong to?"""
-    characters : list[str]
-    """The simplified Chinese characters in this word or expression, as a list of individual characters."""
-    pinyin : list[str]
+    characters : str
+    """The simplified Chinese characters in this word or expression. A `str` indexes and iterates per character, so no per-character allocation is needed."""
+    pinyin : tuple[str, ...]
     """The pinyin spellings of each character in this word or expression."""
-    meanings : list[str]
+    meanings : tuple[str, ...]
     """Different ways to translate this word or expression into English."""
     index: int
-    """Position of this entry in the `State.data` list."""
+    """Position of this entry in the `State` column arrays."""
+
+
+class WeightedPicker:
+    """
+    Draws indices proportionally to a fixed weight vector in O(1) per draw, using Vose's alias method.
+    Building the table is O(n); build a new picker whenever the weights change.
+    """
+    prob  : list[float]
+    """Probability of keeping column `i` when it is drawn (as opposed to redirecting to `alias[i]`)."""
+    alias : list[int]
+    """Index to redirect to when column `i` is drawn but fails the `prob[i]` check."""
+    rng   : np.random.Generator
+    count : int
+
+    _indices  : np.ndarray
+    """Pre-generated column draws, consumed through `_cursor` and refilled in bulk."""
+    _uniforms : np.ndarray
+    """Pre-generated uniforms for the keep-or-alias check, consumed in lockstep with `_indices`."""
+    _cursor   : int
+
+    BATCH_SIZE : int = 256
+    """How many draws to pre-generate per RNG call; vectorized generation is far cheaper than per-draw calls."""
+
+    def __init__(self, weights: np.ndarray, rng: np.random.Generator):
+        count = len(weights)
+        # Normalizing is a single vectorized pass; the table construction below stays in plain Python.
+        scaled = (weights * (count / float(weights.sum()))).tolist()
+
+        prob = [ 1.0 ] * count
+        alias = list(range(count))
+
+        small = [ i for i, share in enumerate(scaled) if share < 1.0 ]
+        large = [ i for i, share in enumerate(scaled) if share >= 1.0 ]
+
+        # Pair each under-full column with an over-full one until everything holds exactly one unit.
+        while small and large:
+            under = small.pop()
+            over = large.pop()
+
+            prob[under] = scaled[under]
+            alias[under] = over
+
+            scaled[over] -= 1.0 - scaled[under]
+            (small if scaled[over] < 1.0 else large).append(over)
+
+        self.prob = prob
+        self.alias = alias
+        self.rng = rng
+        self.count = count
+        self._refill()
+
+    def _refill(self) -> None:
+        """Pre-generate the next `BATCH_SIZE` draws in two vectorized RNG calls."""
+        self._indices = self.rng.integers(0, self.count, size=self.BATCH_SIZE)
+        self._uniforms = self.rng.random(size=self.BATCH_SIZE)
+        self._cursor = 0
+
+    def pick(self) -> int:
+        """Draw one index with probability proportional to its weight. Amortized two array reads, no scan."""
+        if self._cursor == self.BATCH_SIZE:
+            self._refill()
+
+        i = int(self._indices[self._cursor])
+        uniform = self._uniforms[self._cursor]
+        self._cursor += 1
+
+        if uniform < self.prob[i]:
+            return i
+        return self.alias[i]
 
 
 class State:
-    data       : list[Entry]
-    rng        : random.Random
-    level_tops : list[int]
-    weights    : float
+    # The database is stored column-wise (struct-of-arrays): one small array/list per field
+    # instead of thousands of per-entry objects. `get_entry` builds an `Entry` view on demand.
+    levels     : np.ndarray
+    """HSK2.0 level per entry, as an int8 array."""
+    characters : list[str]
+    """Simplified Chinese characters per entry."""
+    pinyin     : list[tuple[str, ...]]
+    """Pinyin spellings per entry, one per character."""
+    meanings   : list[tuple[str, ...]]
+    """English translations per entry."""
+
+    rng           : np.random.Generator
+    level_tops    : list[int]
+    level_bottoms : list[int]
+    """For each level, the first entry index eligible when that level is the minimum. Derived from `level_tops` once at load."""
+    weight_exp : np.ndarray
+    """Per-entry weight exponent as uint8; the effective weight is `2 ** exp`. Doubling/halving is an exact +-1, with no float drift."""
+
+    _pick : Callable[[], Entry] | None
+    """Draw function specialized to the current level range and weights; `None` whenever it needs rebuilding."""
 
     min_level : int
     max_level : int
 
-    entry_history : list[Entry]
-    """Timeline of entries that have been picked so far."""
+    entry_history : deque[Entry]
+    """Timeline of entries that have been picked so far. Bounded to `MAX_HISTORY`; old entries fall off the left."""
     current_entry : int
     """Index into the `entry_history` array indicating where we are in the timeline."""
     prob_modifier : int
@@ -54,61 +180,131 @@ class State:
 
     MAX_HISTORY : int = 128
 
-    WEIGHT_MULTIPLIER : float = 2.0
-    MIN_WEIGHT        : float = 1.0
-    STARTING_WEIGHT   : float = MIN_WEIGHT * (WEIGHT_MULTIPLIER ** 6)
-    MAX_WEIGHT        : float = STARTING_WEIGHT * (WEIGHT_MULTIPLIER ** 6)
+    CSV_PATH   : str = "data/hsk-manual.csv"
+    CACHE_PATH : str = "data/hsk-manual.pkl"
+    """Pickle cache of the parsed database, valid as long as it is at least as new as `CSV_PATH`."""
+
+    START_WEIGHT_EXP : int = 6
+    MAX_WEIGHT_EXP   : int = 12
+    """Weight exponents range over [0, 12], i.e. weights over [1, 4096], starting in the middle at 64."""
 
     def __init__(self):
-        csv_data = pd.read_csv("data/hsk-manual.csv")
-        self.data = [ self._entry_from_csv(csv_data, i) for i in csv_data.index ]
-        self.level_tops = [ int(csv_data.index[csv_data["level"] <= i+1].max()) for i in range(6) ]
-        self.weights = [ self.STARTING_WEIGHT for _ in self.data ]
-        self.rng = random.Random()
+        self._load_database()
+        # Since each top is stored inclusive, the bottom of a level is the top of the previous one + 1.
+        self.level_bottoms = [ 0 ] + [ top + 1 for top in self.level_tops[:-1] ]
+        self.weight_exp = np.full(len(self.characters), self.START_WEIGHT_EXP, dtype=np.uint8)
+        self.rng = np.random.default_rng()
+        self._pick = None
 
         self.min_level = 1
         self.max_level = 3
 
-        self.entry_history = [ self.get_random_entry() ]
+        self.entry_history = deque([ self.get_random_entry() ], maxlen=self.MAX_HISTORY)
         self.current_entry = 0
         self.prob_modifier = 0
 
         self.show_pinyin = False
 
-    def _entry_from_csv(self, csv_data: pd.DataFrame, index: int) -> Entry:
-        assert index in csv_data.index, f"{index=} not contained in {csv_data.index=}"
-        row = csv_data.loc[index]
-
-        level = int(row["level"])
-        characters = [ char for char in row["hanzi"] ]
-        pinyin = row["pinyin"].split()
-        meanings = [ entry.strip() for entry in row["meanings"].split(";") ]
+    def _load_database(self) -> None:
+        """
+        Load the word database, preferring the pickle cache when it is at least as new as the CSV.
+        A cache hit skips CSV parsing and validation entirely; a miss parses, validates, and rewrites the cache.
+        """
+        if os.path.exists(self.CACHE_PATH) and os.path.getmtime(self.CACHE_PATH) >= os.path.getmtime(self.CSV_PATH):
+            with open(self.CACHE_PATH, "rb") as file:
+                self.levels, self.characters, self.pinyin, self.meanings, self.level_tops = pickle.load(file)
+            return
 
-        assert 1 <= level <= 6, f"[{index=}] Expected 1 <= level <= 6; found {level=}"
-        assert len(characters) > 0, f"[{index=}] Expected at leas one character, found none!"
-        assert len(characters) == len(pinyin), f"[{index=}] Expected characters and pinyin to have the same length; found {len(characters)=}; {len(pinyin)}. {characters=}; {pinyin=}"
-        assert len(meanings) > 0, f"[{index=}] Expected at leas one meaning, found none!"
+        self.levels, self.characters, self.pinyin, self.meanings = self._read_database()
+        self._validate()
+        self.level_tops = self._find_level_tops(self.levels)
+
+        with open(self.CACHE_PATH, "wb") as file:
+            pickle.dump((self.levels, self.characters, self.pinyin, self.meanings, self.level_tops), file, protocol=5)
+
+    @staticmethod
+    def _read_database() -> tuple[np.ndarray, list[str], list[tuple[str, ...]], list[tuple[str, ...]]]:
+        """Parse the word database into parallel per-field arrays in a single pass, so nothing needs re-parsing per flashcard flip."""
+        levels : list[int] = []
+        characters : list[str] = []
+        pinyin : list[tuple[str, ...]] = []
+        meanings : list[tuple[str, ...]] = []
+
+        with open(State.CSV_PATH, newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                levels.append(int(row["level"]))
+                characters.append(row["hanzi"])
+                pinyin.append(tuple(row["pinyin"].split()))
+                meanings.append(tuple(entry.strip() for entry in row["meanings"].split(";")))
+
+        return (np.asarray(levels, dtype=np.int8), characters, pinyin, meanings)
+
+    def _validate(self) -> None:
+        """Check structural invariants of the parsed database. Called once at load time; nothing runs on the per-flip path."""
+        assert ((self.levels >= 1) & (self.levels <= 6)).all(), f"Expected 1 <= level <= 6 for all entries; found {np.unique(self.levels)=}"
+
+        for index in range(len(self.characters)):
+            characters = self.characters[index]
+            pinyin = self.pinyin[index]
+            meanings = self.meanings[index]
+
+            assert len(characters) > 0, f"[{index=}] Expected at leas one character, found none!"
+            assert len(characters) == len(pinyin), f"[{index=}] Expected characters and pinyin to have the same length; found {len(characters)=}; {len(pinyin)}. {characters=}; {pinyin=}"
+            assert len(meanings) > 0, f"[{index=}] Expected at leas one meaning, found none!"
+
+    @staticmethod
+    def _find_level_tops(levels: np.ndarray) -> list[int]:
+        """
+        For each HSK2.0 level 1-6, find the highest index of any entry at or below that level.
+        Vectorized; does not require the levels to be sorted (the hand-cleaned CSV has out-of-order rows).
+        """
+        # Scatter the highest index per level, then let each level inherit the top of the
+        # level below if that one reaches further (or the level has no entries of its own).
+        tops = np.zeros(6, dtype=np.int64)
+        np.maximum.at(tops, levels.astype(np.int64) - 1, np.arange(len(levels)))
+        return np.maximum.accumulate(tops).tolist()
 
-        return Entry(level, characters, pinyin, meanings, index)
+    def get_entry(self, index: int) -> Entry:
+        """Build an `Entry` view of database row `index`."""
+        return Entry(int(self.levels[index]), self.characters[index], self.pinyin[index], self.meanings[index], index)
 
     def set_min_level(self, level: int) -> None:
         assert 1 <= level <= 6, f"Expected 1 <= level <= 6; found {level=}"
         assert level <= self.max_level, f"Expected level <= self.max_level. Found {level=}; {self.max_level=}"
         self.min_level = level
+        self._pick = None
 
     def set_max_level(self, level: int) -> None:
         assert 1 <= level <= 6, f"Expected 1 <= level <= 6; found {level=}"
         assert self.min_level <= level, f"Expected self.min_level <= level. Found {level=}; {self.min_level=}"
         self.max_level = level
+        self._pick = None
 
-    def get_random_entry(self) -> Entry:
-        # We have to shift the levels from 1-indexed to 0-indexed when looking up values in level_tops.
-        # Since we store the top inclusive, the bottom is the previous top + 1.
-        bottom = 0 if self.min_level < 2 else self.level_tops[self.min_level - 2] + 1
-        top = self.level_tops[self.max_level-1]
+    def _level_range(self, min_level: int, max_level: int) -> tuple[int, int]:
+        """Returns the (inclusive) entry index range covered by the given level range."""
+        # We have to shift the levels from 1-indexed to 0-indexed when looking up values in the tables.
+        return (self.level_bottoms[min_level - 1], self.level_tops[max_level - 1])
+
+    def _make_picker(self) -> Callable[[], Entry]:
+        """
+        Specialize a draw function to the current level range and weights, so the per-draw
+        path is just the captured locals. Rebuilt lazily whenever either input changes.
+        """
+        bottom, top = self._level_range(self.min_level, self.max_level)
+        # Expand the exponents into float weights just for the table build; one vectorized shift.
+        weights = (1 << self.weight_exp[bottom : top + 1].astype(np.int64)).astype(np.float64)
+        pick = WeightedPicker(weights, self.rng).pick
+        get_entry = self.get_entry
 
-        entry = self.rng.choices(population=self.data[bottom:top+1], weights=self.weights[bottom:top+1])[0]
-        return entry
+        def draw() -> Entry:
+            return get_entry(bottom + pick())
+
+        return draw
+
+    def get_random_entry(self) -> Entry:
+        if self._pick is None:
+            self._pick = self._make_picker()
+        return self._pick()
 
     def change_current_entry(self, new_idx: int) -> Entry:
         """
@@ -118,8 +314,9 @@ class State:
         new_idx : int
             Index into the `entry_history` list.
         """
-        assert 0 <= self.current_entry < len(self.entry_history), f"Expected 0 <= self.current_entry <= {len(self.entry_history)}, but found {self.current_entry=}"
-        assert 0 <= new_idx < len(self.entry_history), f"Expected 0 <= new_idx <= {len(self.entry_history)}, but found {new_idx=}"
+        # Internal invariants; kept message-free since these run on every user action.
+        assert 0 <= self.current_entry < len(self.entry_history)
+        assert 0 <= new_idx < len(self.entry_history)
 
         old_entry = self.entry_history[self.current_entry]
         new_entry = self.entry_history[new_idx]
@@ -128,10 +325,13 @@ class State:
             # Early exit, nothing to change.
             return old_entry
 
-        if (self.prob_modifier > 0) and (self.weights[old_entry.index] < self.MAX_WEIGHT):
-            self.weights[old_entry.index] *= 2.0
-        elif (self.prob_modifier < 0) and (self.weights[old_entry.index] > self.MIN_WEIGHT):
-            self.weights[old_entry.index] /= 2.0
+        exp = int(self.weight_exp[old_entry.index])
+        if (self.prob_modifier > 0) and (exp < self.MAX_WEIGHT_EXP):
+            self.weight_exp[old_entry.index] = exp + 1
+            self._pick = None
+        elif (self.prob_modifier < 0) and (exp > 0):
+            self.weight_exp[old_entry.index] = exp - 1
+            self._pick = None
 
         self.current_entry = new_idx
         self.prob_modifier = 0
@@ -140,7 +340,7 @@ class State:
 
     def get_current_entry(self) -> Entry:
         """Returns the current entry."""
-        assert 0 <= self.current_entry < len(self.entry_history), f"Expected 0 <= self.current_entry <= {len(self.entry_history)}, but found {self.current_entry=}"
+        assert 0 <= self.current_entry < len(self.entry_history)
         return self.entry_history[self.current_entry]
 
     def move_to_previous_entry(self) -> Entry:
@@ -155,11 +355,8 @@ class State:
         """
 
         if self.current_entry == len(self.entry_history) - 1:
+            # At capacity, the bounded deque evicts the oldest entry in O(1) (list.pop(0) was O(n)).
             self.entry_history.append(self.get_random_entry())
-
-            if len(self.entry_history) > self.MAX_HISTORY:
-                self.entry_history.pop(0)
-
             new_idx = len(self.entry_history) - 1
         else:
             new_idx = self.current_entry + 1
@@ -253,12 +450,19 @@ class TextDisplayInner(QtWidgets.QWidget):
     character_font : QtGui.QFont
     layout         : QtWidgets.QLayout
 
+    pinyin_labels    : list[QtWidgets.QLabel]
+    """Pool of reusable pinyin labels (grid row 0), grown to the longest word seen so far."""
+    character_labels : list[QtWidgets.QLabel]
+    """Pool of reusable character labels (grid row 1), grown to the longest word seen so far."""
+
     def __init__(self, state: State, latin_font: QtGui.QFont, character_font: QtGui.QFont):
         super().__init__()
 
         self.state = state
         self.latin_font = latin_font
         self.character_font = character_font
+        self.pinyin_labels = []
+        self.character_labels = []
 
         self.init_ui()
 
@@ -271,21 +475,37 @@ class TextDisplayInner(QtWidgets.QWidget):
         self.populate()
 
     def populate(self) -> None:
-        clear_layout(self.layout)
-
         entry = self.state.get_current_entry()
+        self._grow_pools(len(entry.characters))
 
-        for i, (character, pinyin) in enumerate(zip(entry.characters, entry.pinyin)):
-            if self.state.show_pinyin:
-                pinyin_label = QtWidgets.QLabel(pinyin)
-                pinyin_label.setFont(self.latin_font)
-                pinyin_label.setAlignment(Qt.AlignCenter)
-                self.layout.addWidget(pinyin_label   , 0, i)
+        # Reuse pooled labels instead of rebuilding them: creating widgets and re-running
+        # the layout on every flip is the expensive part, setText/setVisible is cheap.
+        for i, (pinyin_label, character_label) in enumerate(zip(self.pinyin_labels, self.character_labels)):
+            in_use = i < len(entry.characters)
 
-            character_label = QtWidgets.QLabel(character)
+            if in_use:
+                pinyin_label.setText(entry.pinyin[i])
+                character_label.setText(entry.characters[i])
+
+            pinyin_label.setVisible(in_use and self.state.show_pinyin)
+            character_label.setVisible(in_use)
+
+    def _grow_pools(self, count: int) -> None:
+        """Make sure at least `count` (pinyin, character) label pairs exist in the grid."""
+        while len(self.character_labels) < count:
+            i = len(self.character_labels)
+
+            pinyin_label = QtWidgets.QLabel()
+            pinyin_label.setFont(self.latin_font)
+            pinyin_label.setAlignment(Qt.AlignCenter)
+            self.layout.addWidget(pinyin_label, 0, i)
+            self.pinyin_labels.append(pinyin_label)
+
+            character_label = QtWidgets.QLabel()
             character_label.setFont(self.character_font)
             character_label.setAlignment(Qt.AlignCenter)
             self.layout.addWidget(character_label, 1, i)
+            self.character_labels.append(character_label)
 
 
 class TextDisplay(QtWidgets.QWidget):
@@ -293,11 +513,17 @@ class TextDisplay(QtWidgets.QWidget):
     inner_display : TextDisplayInner
     hsk_display   : QtWidgets.QLabel
 
+    _last_level : int
+    """Level currently shown in `hsk_display`, so unchanged levels skip the setText (and the repaint it schedules). 0 = nothing shown yet."""
+
+    HSK_LABELS : tuple[str, ...] = ( "HSK1", "HSK2", "HSK3", "HSK4", "HSK5", "HSK6" )
+
     def __init__(self, state: State, latin_font: QtGui.QFont, character_font: QtGui.QFont):
         super().__init__()
 
         self.state = state
         self.inner_display = TextDisplayInner(state, latin_font, character_font)
+        self._last_level = 0
 
         self.init_ui()
 
@@ -318,7 +544,10 @@ class TextDisplay(QtWidgets.QWidget):
     def populate(self) -> None:
         self.inner_display.populate()
         entry = self.state.get_current_entry()
-        self.hsk_display.setText(f"HSK{entry.level}")
+
+        if entry.level != self._last_level:
+            self.hsk_display.setText(self.HSK_LABELS[entry.level - 1])
+            self._last_level = entry.level
 
 
 class MeaningDisplay(QtWidgets.QWidget):
@@ -326,11 +555,18 @@ class MeaningDisplay(QtWidgets.QWidget):
     latin_font : QtGui.QFont
     layout     : QtWidgets.QLayout
 
+    meaning_labels : list[QtWidgets.QLabel]
+    """Pool of reusable meaning labels, grown to the longest meaning list seen so far."""
+    _shown_entry : Entry | None
+    """The entry whose meanings are currently materialized in the labels, or `None` if none is yet."""
+
     def __init__(self, state: State, latin_font: QtGui.QFont):
         super().__init__()
 
         self.state = state
         self.latin_font = latin_font
+        self.meaning_labels = []
+        self._shown_entry = None
 
         self.init_ui()
 
@@ -341,18 +577,39 @@ class MeaningDisplay(QtWidgets.QWidget):
         self.populate()
 
     def populate(self) -> None:
-        clear_layout(self.layout)
-
+        # When the meanings are hidden, just hide the whole container: zero label churn,
+        # and whatever is in the labels stays valid for the next time this entry shows.
+        # Prev/Next keep pinyin hidden, so the common hidden-to-hidden flip exits without touching Qt at all.
         if not self.state.show_pinyin:
+            if not self.isHidden():
+                self.setVisible(False)
             return
 
         entry = self.state.get_current_entry()
 
-        for meaning in entry.meanings:
-            meaning_label = QtWidgets.QLabel(text=meaning)
+        if entry is not self._shown_entry:
+            self._grow_pool(len(entry.meanings))
+
+            for i, meaning_label in enumerate(self.meaning_labels):
+                in_use = i < len(entry.meanings)
+
+                if in_use:
+                    meaning_label.setText(entry.meanings[i])
+
+                meaning_label.setVisible(in_use)
+
+            self._shown_entry = entry
+
+        self.setVisible(True)
+
+    def _grow_pool(self, count: int) -> None:
+        """Make sure at least `count` meaning labels exist in the layout."""
+        while len(self.meaning_labels) < count:
+            meaning_label = QtWidgets.QLabel()
             meaning_label.setFont(self.latin_font)
             meaning_label.setAlignment(Qt.AlignCenter)
             self.layout.addWidget(meaning_label)
+            self.meaning_labels.append(meaning_label)
 
 
 class ControlButtons(QtWidgets.QWidget):
@@ -388,12 +645,12 @@ class ControlButtons(QtWidgets.QWidget):
     def init_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout()
 
-        self.icon_show = QtGui.QIcon("data/eye.png")
-        self.icon_hide = QtGui.QIcon("data/eye-slash.png")
-        self.icon_next = QtGui.QIcon("data/square-caret-right.png")
-        self.icon_prev = QtGui.QIcon("data/square-caret-left.png")
-        self.icon_plus = QtGui.QIcon("data/square-plus.png")
-        self.icon_minus = QtGui.QIcon("data/square-minus.png")
+        self.icon_show = get_icon("data/eye.png")
+        self.icon_hide = get_icon("data/eye-slash.png")
+        self.icon_next = get_icon("data/square-caret-right.png")
+        self.icon_prev = get_icon("data/square-caret-left.png")
+        self.icon_plus = get_icon("data/square-plus.png")
+        self.icon_minus = get_icon("data/square-minus.png")
 
         # ---------------------------------------------------------------- #
 
@@ -474,8 +731,18 @@ class MainWindow(QtWidgets.QWidget):
     meaning_display : MeaningDisplay
     control_buttons : ControlButtons
 
+    _key_handlers : dict[int, Callable[[], None]]
+    """Maps key codes to the action triggered when that key is pressed."""
+
+    _pending_advance : int
+    """Next presses received but not yet applied; flushed in one batch by `_advance_timer`."""
+    _advance_timer : QtCore.QTimer
+    """Single-shot timer that coalesces rapid Next presses (e.g. holding Enter) into one state update and repaint."""
+
+    ADVANCE_DEBOUNCE_MS : int = 15
+
     def __init__(self, app: QtWidgets.QApplication):
-        super().__init__(windowTitle="HSK Flashcards", windowIcon=QtGui.QIcon("data/字.png"))
+        super().__init__(windowTitle="HSK Flashcards", windowIcon=get_icon("data/字.png"))
 
         self.app = app
 
@@ -483,6 +750,10 @@ class MainWindow(QtWidgets.QWidget):
         self.latin_font = QtGui.QFont("Arial", pointSize=16)
         self.character_font = QtGui.QFont("KaiTi, 'AR PL UKai CN'", pointSize=80)
 
+        self._pending_advance = 0
+        self._advance_timer = QtCore.QTimer(self, singleShot=True, interval=self.ADVANCE_DEBOUNCE_MS)
+        self._advance_timer.timeout.connect(self._flush_advance)
+
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -502,62 +773,85 @@ class MainWindow(QtWidgets.QWidget):
 
         self.setLayout(main_layout)
 
+        self._key_handlers = {
+            Qt.Key_Backspace : self.step_back,
+            Qt.Key_Return    : self.step_forward,
+            Qt.Key_Minus     : self.control_buttons.on_minus,
+            Qt.Key_Equal     : self.control_buttons.on_plus, # It's the key that has the plus sign in US layout.
+            Qt.Key_Space     : self.toggle_pinyin,
+            Qt.Key_Escape    : self.app.quit,
+        }
+
     def step_back(self) -> None:
+        # Apply any queued advances synchronously first so Next-then-Prev keeps its ordering.
+        if self._pending_advance > 0:
+            self._advance_timer.stop()
+            self._apply_advances(self._pending_advance)
+            self._pending_advance = 0
+
         self.state.show_pinyin = False
         self.state.move_to_previous_entry()
         self.refresh()
 
     def step_forward(self) -> None:
+        self._pending_advance += 1
+        self._advance_timer.start()
+
+    def _flush_advance(self) -> None:
+        """Hand all Next presses queued during the debounce window to an async task."""
+        count = self._pending_advance
+        self._pending_advance = 0
+
+        if count > 0:
+            asyncio.ensure_future(self._advance_async(count))
+
+    async def _advance_async(self, count: int) -> None:
+        """Run the queued advances (random draws, possible picker rebuilds) on a worker thread, then repaint once on the GUI thread."""
         self.state.show_pinyin = False
-        self.state.move_to_next_entry()
+        await asyncio.to_thread(self._apply_advances, count)
         self.refresh()
 
+    def _apply_advances(self, count: int) -> None:
+        for _ in range(count):
+            self.state.move_to_next_entry()
+
     def refresh(self) -> None:
-        self.level_selector.update_ui()
-        self.text_display.populate()
-        self.meaning_display.populate()
-        self.control_buttons.update_ui()
+        # Suspend painting while all four sections update, so Qt coalesces them into one paint pass.
+        self.setUpdatesEnabled(False)
+        try:
+            self.level_selector.update_ui()
+            self.text_display.populate()
+            self.meaning_display.populate()
+            self.control_buttons.update_ui()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def toggle_pinyin(self) -> None:
         self.state.show_pinyin = not self.state.show_pinyin
         self.refresh()
 
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if event.type() == QtCore.QEvent.KeyPress:
-            if event.key() == Qt.Key_Backspace:
-                self.step_back()
-                return True
-
-            if event.key() == Qt.Key_Return:
-                self.step_forward()
-                return True
-
-            if event.key() == Qt.Key_Minus:
-                self.control_buttons.on_minus()
-                return True
-
-            if event.key() == Qt.Key_Equal: # It's the key that has the plus sign in US layout.
-                self.control_buttons.on_plus()
-                return True
-
-            if event.key() == Qt.Key_Space:
-                self.toggle_pinyin()
-                return True
+        # This filter sees every event the app delivers, so bail out of anything that isn't a key press right away.
+        if event.type() != QtCore.QEvent.KeyPress:
+            return super().eventFilter(obj, event)
 
-            if event.key() == Qt.Key_Escape:
-                self.app.quit()
-                return True
+        handler = self._key_handlers.get(event.key())
+        if handler is not None:
+            handler()
+            return True
 
         return super().eventFilter(obj, event)
 
 
 def main() -> None:
     app = QtWidgets.QApplication(sys.argv)
+    QtCore.QThreadPool.globalInstance().start(IconPreloader())
     window = MainWindow(app)
     app.installEventFilter(window)
     window.show()
 
-    sys.exit(app.exec())
+    # Run the Qt loop with asyncio integration so state updates can be awaited off the GUI thread.
+    QtAsyncio.run(handle_sigint=True)
 
 
 if __name__ == "__main__":
@@ -1,34 +1,66 @@
 #!/usr/bin/env python3
 
 
+import os
+
 import pandas as pd
 from pretty_cli import PrettyCli
 
 
+XLSX_PATH    = "data/Chinese language database _ 中文数据库.xlsx"
+CSV_PATH     = "data/hsk2.csv"
+PARQUET_PATH = "data/hsk2.parquet"
+
+
+def read_excel() -> pd.DataFrame:
+    """Read the source spreadsheet, using the calamine engine if installed (much faster than openpyxl on big sheets)."""
+    # Only the five columns we keep: level (C), general standard (E), character (K), pinyin (L), translation (O).
+    kwargs = dict(sheet_name="All Characters (HSK 2.0)", usecols="C,E,K,L,O", skiprows=4, header=None)
+    try:
+        return pd.read_excel(XLSX_PATH, engine="calamine", **kwargs)
+    except ImportError: # python-calamine not installed.
+        return pd.read_excel(XLSX_PATH, **kwargs)
+
+
 def main() -> None:
     cli = PrettyCli()
     cli.main_title("Convert Data")
 
+    # ================================================================ #
+    cli.section("Checking Freshness")
+
+    if os.path.exists(CSV_PATH) and os.path.getmtime(CSV_PATH) > os.path.getmtime(XLSX_PATH):
+        cli.print(f"{CSV_PATH} is newer than the source spreadsheet; nothing to do.")
+        return
+
+    cli.print("CSV missing or stale; converting.")
+
     # ================================================================ #
     cli.section("Loading Data")
-    xl = pd.read_excel("data/Chinese language database _ 中文数据库.xlsx", sheet_name="All Characters (HSK 2.0)", usecols="B:O", skiprows=4, header=None)
+    xl = read_excel()
     cli.print("Read OK")
 
     # ================================================================ #
     cli.section("Extracting Subset")
 
-    subset = xl.loc[:, [2, 4, 10, 11, 14]]
+    subset = xl
     subset.columns = [ "level", "general_standard", "character", "pinyin", "translation" ]
-    subset = subset.dropna()
-    subset["level"] = subset["level"].astype(int)
-    subset["general_standard"] = subset["general_standard"].astype(int)
+    # Levels fit in a byte; the General Standard numbering tops out around 8000, so int16 is plenty.
+    subset = subset.dropna().astype({ "level": "int8", "general_standard": "int16" })
 
     cli.print(subset)
 
     # ================================================================ #
     cli.section("Saving Data")
-    subset.to_csv("data/hsk2.csv", index=False)
+    subset.to_csv(CSV_PATH, index=False)
     cli.print("Write OK")
 
+    # Typed, compressed sidecar: much faster for any consumer that can read parquet.
+    try:
+        subset.to_parquet(PARQUET_PATH, compression="zstd")
+        cli.print("Parquet write OK")
+    except ImportError: # No parquet engine (pyarrow/fastparquet) installed.
+        cli.print("No parquet engine installed; skipping parquet sidecar.")
+
 if __name__ == "__main__":
     main()
@@ -25,7 +25,9 @@ def main() -> None:
     # ================================================================ #
     cli.section("Extracting Subset")
 
-    df = pd.DataFrame()
+    # Accumulate plain dicts and build the DataFrame once at the end: concatenating row-by-row
+    # copies the whole growing frame each time, which is quadratic in the number of rows.
+    records = []
 
     pinyin_counts = []
 
@@ -38,19 +40,21 @@ def main() -> None:
         pinyin_counts.append(len(pd.Series([ form["transcriptions"]["pinyin"] for form in entry["forms"]]).unique()))
 
         for form in entry["forms"]:
-            row = pd.DataFrame({
-                "hanzi": entry["simplified"],
-                "level": level,
-                "frequency": int(entry["frequency"]),
-                "pinyin": form["transcriptions"]["pinyin"],
-                "meanings": form["meanings"],
-            })
-
-            df = pd.concat([ df, row ])
+            # One row per meaning, matching the broadcast the old per-form DataFrame did.
+            for meaning in form["meanings"]:
+                records.append({
+                    "hanzi": entry["simplified"],
+                    "level": level,
+                    "frequency": int(entry["frequency"]),
+                    "pinyin": form["transcriptions"]["pinyin"],
+                    "meanings": meaning,
+                })
 
         # print(entry)
         # break
 
+    df = pd.DataFrame.from_records(records)
+
     df = df.sort_values(by=["level", "frequency", "pinyin"], ascending=True)
 
     cli.print(df)
@@ -25,9 +25,13 @@ def main() -> None:
     data = pd.read_csv("data/hsk2.csv")
     rng = random.Random()
 
+    # Pull the columns out once; .loc per click builds a whole Series just to read three cells.
+    characters = data["character"].to_numpy()
+    pinyins = data["pinyin"].to_numpy()
+    translations = data["translation"].to_numpy()
+
     def get_entry(idx):
-        row = data.loc[idx]
-        return Entry(character=row["character"], pinyin=row["pinyin"], translation=row["translation"])
+        return Entry(character=characters[idx], pinyin=pinyins[idx], translation=translations[idx])
 
     first_entry = data[data["character"] == "字"]
     first_entry = get_entry(first_entry.index.item())
@@ -38,7 +42,7 @@ def main() -> None:
 
     def get_random_entry():
         top = level_tops[state.level]
-        idx = rng.randint(0, top)
+        idx = rng.randrange(top + 1)
         state.current_entry = get_entry(idx)
         update_view()
 